@@ -21,15 +21,18 @@ import stat
 import hashlib
 import tempfile
 import multiprocessing
-import queue
+import concurrent.futures
 import gzip
+import io
+import threading
 import pathlib
 import logging
-import re
 import urllib
 
 # import the requests module for downloading the XML
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # import YAML module
 from yaml import load
@@ -38,50 +41,273 @@ try:
 except ImportError:
     from yaml import Loader
 
+# size of the chunks that are read from the network and written to disk
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
 
-# use several threads to download the Debian data. This is of no
-# use if you are on a slow line with a bandwidth cap and it might
-# actually be beneficial to use just a single thread.
-def downloadfile(download_queue, fail_queue, debian_mirror):
-    '''Download files from a Debian mirror'''
-    while True:
-        (debiandir, debianfile, debiansize, basestoredirectory) = download_queue.get()
-
-        storeparts = debiandir.parts
-        resultfilename = pathlib.Path(basestoredirectory, storeparts[1], debianfile)
-        downloadurl = '%s/%s/%s' % (debian_mirror, debiandir, debianfile)
-
-        # first check if the file already exists and is the right size
-        if resultfilename.exists():
-            if resultfilename.stat().st_size == debiansize and debiansize != 0:
-                logging.info('ALREADY DOWNLOADED: %s', downloadurl)
-                download_queue.task_done()
-                continue
-            # else remove the file as it is likely a failed download
-            os.unlink(resultfilename)
+# size of the read buffer used when processing the ls-lR.gz file
+LSLR_BUFFER_SIZE = 128 * 1024
 
-        logging.info('DOWNLOADING: %s', downloadurl)
-        try:
-            req = requests.get(downloadurl)
-        except requests.exceptions.RequestException:
-            fail_queue.put(debianfile)
-            download_queue.task_done()
+# maximum number of files that are handed to a download thread at once
+DOWNLOAD_BATCH_SIZE = 64
+
+# suffixes of the original source code archives
+SOURCE_SUFFIXES = ('.orig.tar.bz2', '.orig.tar.gz', '.orig.tar.xz')
+
+
+def create_session(pool_size=1):
+    '''Create a HTTP session that keeps connections to the mirror alive'''
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3,
+                    status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                          max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def scan_existing_files(store_directories, debian_directories):
+    '''Return a dict with the sizes of the files that were already downloaded
+
+    Files are stored directly in a subdirectory (for example 'main') of
+    a store directory, so only these subdirectories are scanned.
+    '''
+    existing_files = {}
+    for store_directory in store_directories:
+        for debian_dir in debian_directories:
+            directory = os.path.join(store_directory, debian_dir)
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                existing_files[entry.path] = entry.stat().st_size
+                        except OSError:
+                            logging.info('CANNOT STAT: %s', entry.path)
+            except OSError:
+                logging.info('CANNOT SCAN: %s', directory)
+    return existing_files
+
+
+def parse_lslr(lslr, repository, store_directories):
+    '''Process the lines of a ls-lR.gz file and return the files to download
+
+    Each file is returned as a tuple with the directory on the mirror, the
+    file name, the size and the directory where the file will be stored.
+    The directories are strings, not pathlib.Path objects.
+    store_directories maps the categories 'binary', 'dsc', 'patch' and
+    'source' to the directories where files from that category are stored.
+    '''
+    tasks = []
+    seen_files = set()
+
+    categories = repository['categories']
+    download_dev = 'dev' in categories
+
+    binary_directory = store_directories['binary']
+    dsc_directory = store_directories['dsc']
+    patches_directory = store_directories['patch']
+    source_directory = store_directories['source']
+
+    # suffixes of binary packages for the configured architectures,
+    # computed once so checking a file is a single endswith()
+    binary_suffixes = tuple('_%s%s' % (arch, ext) for ext in ['.deb', '.udeb']
+                            for arch in repository['architectures'])
+
+    # suffixes of all the files that should be downloaded for the
+    # configured categories. This is used to discard all other files
+    # with a single check, before the name is decoded.
+    wanted_suffixes = []
+    if 'binary' in categories:
+        wanted_suffixes += binary_suffixes
+    if 'dsc' in categories:
+        wanted_suffixes.append('.dsc')
+    if 'patch' in categories:
+        wanted_suffixes.append('.diff.gz')
+    if 'source' in categories:
+        wanted_suffixes += SOURCE_SUFFIXES
+    wanted_suffixes = tuple(suffix.encode() for suffix in wanted_suffixes)
+
+    inpool = False
+    download_file = False
+    curdir = ''
+
+    # The lines are kept as bytes and only the parts that are
+    # actually needed are decoded.
+    for i in lslr:
+        if i.startswith(b'./pool'):
+            inpool = True
+            curdir = i.decode().rsplit(':', 1)[0][2:]
+            curdir_parts = curdir.split('/')
+
+            # only download files from the configured directories,
+            # which only needs to be checked once per directory
+            download_file = False
+            for debian_dir in repository['directories']:
+                if debian_dir in curdir_parts:
+                    download_file = True
+                    break
+            continue
+        if not inpool:
             continue
 
-        if req.status_code != 200:
-            fail_queue.put(debianfile)
-            download_queue.task_done()
-            logging.info('FAIL: %s', downloadurl)
+        # end of the pool reached
+        if i.startswith(b'./project'):
+            break
+        if not download_file:
+            continue
+        if not i.startswith(b'-'):
+            continue
+
+        # the file name is at the end of the line, so files
+        # that should not be downloaded can be discarded early
+        line = i.rstrip()
+        if not line.endswith(wanted_suffixes):
             continue
 
-        # write the data to the output file
-        resultfile = open(resultfilename, 'wb')
-        resultfile.write(req.content)
-        resultfile.close()
+        # fields: permissions, links, owner, group, size,
+        # month, day, time or year, name
+        fields = line.split(None, 8)
+        if len(fields) != 9 or not fields[4].isdigit():
+            continue
+        downloadpath = fields[8].decode()
+        filesize = int(fields[4])
+
+        # files can be listed more than once, only download once
+        if (curdir, downloadpath) in seen_files:
+            continue
+        seen_files.add((curdir, downloadpath))
+
+        # Only files from the enabled categories are left. The suffixes
+        # are mutually exclusive, so exactly one of these branches
+        # applies to a file.
+        if downloadpath.endswith(binary_suffixes):
+            if '-dev_' in downloadpath and not download_dev:
+                continue
+            tasks.append((curdir, downloadpath, filesize, binary_directory))
+        elif downloadpath.endswith('.dsc'):
+            tasks.append((curdir, downloadpath, filesize, dsc_directory))
+        elif downloadpath.endswith('.diff.gz'):
+            tasks.append((curdir, downloadpath, filesize, patches_directory))
+        else:
+            tasks.append((curdir, downloadpath, filesize, source_directory))
+    return tasks
+
+
+# use several threads to download the Debian data. This is of no
+# use if you are on a slow line with a bandwidth cap and it might
+# actually be beneficial to use just a single thread.
+#
+# Downloading is I/O bound, so threads are used instead of processes.
+# All threads share a single session, and with it the pool of
+# connections to the mirror.
+def downloadfile(session, debian_mirror, existing_files, debiandir, debianfile,
+                 debiansize, basestoredirectory):
+    '''Download a single file from a Debian mirror, return False if it failed'''
+    storeparts = debiandir.split('/')
+    resultfilename = os.path.join(basestoredirectory, storeparts[1], debianfile)
+    downloadurl = '%s/%s/%s' % (debian_mirror, debiandir, debianfile)
+
+    # first check if the file already exists and is the right size. The
+    # sizes of all existing files were recorded before downloading.
+    existing_size = existing_files.get(resultfilename)
+    resume_from = 0
+    if existing_size is not None:
+        if existing_size == debiansize and debiansize != 0:
+            logging.info('ALREADY DOWNLOADED: %s', downloadurl)
+            return True
+        if 0 < existing_size < debiansize:
+            # likely an interrupted download, so try to only
+            # download the missing data
+            resume_from = existing_size
+        else:
+            # else remove the file as it is likely a failed download
+            os.unlink(resultfilename)
 
-        logging.info('SUCCESS: %s', downloadurl)
+    logging.info('DOWNLOADING: %s', downloadurl)
 
-        download_queue.task_done()
+    # Ask the mirror to not compress the data, so the size sent by
+    # the mirror can be compared with the size in the ls-lR.gz file.
+    headers = {'Accept-Encoding': 'identity'}
+    if resume_from != 0:
+        headers['Range'] = 'bytes=%d-' % resume_from
+    try:
+        req = session.get(downloadurl, headers=headers, stream=True, timeout=(5, 60))
+
+        # Only append to the partial file if the mirror sent exactly
+        # the requested range, without compression (ranges refer to
+        # the compressed data in that case).
+        resumable = False
+        if req.status_code == 206 and resume_from != 0:
+            content_range = req.headers.get('Content-Range', '')
+            content_encoding = req.headers.get('Content-Encoding', 'identity')
+            if content_range.startswith('bytes %d-' % resume_from) and \
+               content_encoding == 'identity':
+                resumable = True
+
+        # the mirror cannot serve the requested range,
+        # so download the whole file instead
+        if req.status_code in [206, 416] and not resumable:
+            req.close()
+            if resume_from != 0:
+                os.unlink(resultfilename)
+                resume_from = 0
+            req = session.get(downloadurl, headers={'Accept-Encoding': 'identity'},
+                              stream=True, timeout=(5, 60))
+
+        with req:
+            if req.status_code == 206 and resumable:
+                # append the missing data to the partial file
+                open_mode = 'ab'
+                expected_size = debiansize - resume_from
+            elif req.status_code == 200:
+                open_mode = 'wb'
+                expected_size = debiansize
+            else:
+                logging.info('FAIL: %s', downloadurl)
+                return False
+
+            # check the size reported by the mirror with the size
+            # recorded in the ls-lR.gz file. If the mirror compressed
+            # the data anyway the size cannot be compared.
+            content_length = req.headers.get('Content-Length')
+            content_encoding = req.headers.get('Content-Encoding', 'identity')
+            if content_length is not None and debiansize != 0 and \
+               content_encoding == 'identity':
+                if int(content_length) != expected_size:
+                    logging.info('SIZE MISMATCH: %s', downloadurl)
+                    return False
+
+            if open_mode == 'ab':
+                logging.info('RESUMING: %s from byte %d', downloadurl, resume_from)
+
+            # stream the data to the output file, instead of
+            # first reading all of it into memory
+            with open(resultfilename, open_mode) as resultfile:
+                for chunk in req.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    resultfile.write(chunk)
+    except requests.exceptions.RequestException:
+        logging.info('FAIL: %s', downloadurl)
+        return False
+
+    logging.info('SUCCESS: %s', downloadurl)
+    return True
+
+
+def downloadbatch(session, debian_mirror, existing_files, tasks, stop_event):
+    '''Download a batch of files, return the names of the files that failed'''
+    failed_files = []
+    for task in tasks:
+        # stop downloading if the crawler is being shut down
+        if stop_event.is_set():
+            break
+        try:
+            if not downloadfile(session, debian_mirror, existing_files, *task):
+                failed_files.append(task[1])
+        except Exception:
+            logging.info('FAIL: %s/%s', task[0], task[1])
+            failed_files.append(task[1])
+    return failed_files
 
 
 def main():
@@ -128,8 +354,8 @@ def main():
 
     # read the configuration file. This is in YAML format
     try:
-        configfile = open(args.cfg, 'r')
-        config = load(configfile, Loader=Loader)
+        with open(args.cfg, 'r', encoding='utf-8') as configfile:
+            config = load(configfile, Loader=Loader)
     except:
         print("Cannot open configuration file, exiting", file=sys.stderr)
         sys.exit(1)
@@ -263,8 +489,7 @@ def main():
     for repository in repositories:
         # create directory for the repository (by name)
         repo_directory = pathlib.Path(storedirectory, repository['name'])
-        if not repo_directory.exists():
-            repo_directory.mkdir()
+        repo_directory.mkdir(exist_ok=True)
 
         # now create a directory structure inside the scandirectory:
         # binary/ -- this is where all the binary data will be stored
@@ -276,28 +501,22 @@ def main():
         #          files will be stored
         # logs/ -- download logs will be stored here
         binary_directory = pathlib.Path(repo_directory, "binary")
-        if not binary_directory.exists():
-            binary_directory.mkdir()
+        binary_directory.mkdir(exist_ok=True)
 
         source_directory = pathlib.Path(repo_directory, "source")
-        if not source_directory.exists():
-            source_directory.mkdir()
+        source_directory.mkdir(exist_ok=True)
 
         meta_data_dir = pathlib.Path(repo_directory, "meta")
-        if not meta_data_dir.exists():
-            meta_data_dir.mkdir()
+        meta_data_dir.mkdir(exist_ok=True)
 
         dsc_directory = pathlib.Path(repo_directory, "dsc")
-        if not dsc_directory.exists():
-            dsc_directory.mkdir()
+        dsc_directory.mkdir(exist_ok=True)
 
         patches_directory = pathlib.Path(repo_directory, "patches")
-        if not patches_directory.exists():
-            patches_directory.mkdir()
+        patches_directory.mkdir(exist_ok=True)
 
         log_directory = pathlib.Path(repo_directory, "logs")
-        if not log_directory.exists():
-            log_directory.mkdir()
+        log_directory.mkdir(exist_ok=True)
 
         download_date = datetime.datetime.utcnow()
         meta_outname = pathlib.Path(meta_data_dir,
@@ -310,14 +529,9 @@ def main():
 
         # recreate the download site data structure
         for i in repository['directories']:
-            if not pathlib.Path(binary_directory, i).exists():
-                pathlib.Path(binary_directory, i).mkdir()
-            if not pathlib.Path(source_directory, i).exists():
-                pathlib.Path(source_directory, i).mkdir()
-            if not pathlib.Path(dsc_directory, i).exists():
-                pathlib.Path(dsc_directory, i).mkdir()
-            if not pathlib.Path(patches_directory, i).exists():
-                pathlib.Path(patches_directory, i).mkdir()
+            for store_directory in [binary_directory, source_directory,
+                                    dsc_directory, patches_directory]:
+                pathlib.Path(store_directory, i).mkdir(parents=True, exist_ok=True)
 
         # Check if the Debian mirror was declared.
         if repository['mirror'] == '':
@@ -341,41 +555,91 @@ def main():
                   file=sys.stderr)
             continue
 
+        # The ETag of the latest ls-lR.gz file is stored in a file
+        # called ETAG. If the mirror reports the same ETag the file
+        # has not changed and does not need to be downloaded again.
+        etagfilename = pathlib.Path(repo_directory, "ETAG")
+        old_etag = None
+        if etagfilename.exists() and not args.force:
+            etagfile = open(etagfilename, 'r')
+            old_etag = etagfile.read()
+            etagfile.close()
+
+        # a single session is used for all requests to the mirror,
+        # including the downloads done by the download threads
+        session = create_session(pool_size=threads)
+        lslr_url = '%s/ls-lR.gz' % repository['mirror']
+        if old_etag:
+            try:
+                req = session.head(lslr_url, allow_redirects=True, timeout=10)
+                if req.headers.get('ETag') == old_etag:
+                    print("Metadata for '%s' has not changed, skipping entry." % repository['name'])
+                    session.close()
+                    continue
+            except requests.exceptions.RequestException:
+                pass
+
         # first download the ls-lR.gz file and see if it needs to be
         # processed by comparing it to the hash of the previously
-        # downloaded file.
+        # downloaded file. If an ETag is known the mirror is asked to
+        # not send the file at all if it is unchanged.
+        headers = {}
+        if old_etag:
+            headers['If-None-Match'] = old_etag
         try:
-            req = requests.get('%s/ls-lR.gz' % repository['mirror'])
+            req = session.get(lslr_url, headers=headers, stream=True, timeout=(5, 30))
         except requests.exceptions.RequestException:
             print("Could not connect to Debian mirror, exiting.", file=sys.stderr)
             sys.exit(1)
 
+        if req.status_code == 304:
+            req.close()
+            session.close()
+            print("Metadata for '%s' has not changed, skipping entry." % repository['name'])
+            continue
+
         if req.status_code != 200:
             print("Could not get Debian ls-lR.gz file, got code %d, exiting." % req.status_code,
                   file=sys.stderr)
             sys.exit(1)
 
-        # now store the ls-lR.gz file for future reference
+        new_etag = req.headers.get('ETag')
+
+        # now store the ls-lR.gz file for future reference and at the
+        # same time compute the SHA256 of the file to see if it is
+        # already known. The data is only processed once, in chunks.
         meta_outname = pathlib.Path(meta_data_dir,
                                     "ls-lR.gz-%s" % download_date.strftime("%Y%m%d-%H%M%S"))
-        metadata = meta_outname.open(mode='wb')
-        metadata.write(req.content)
-        metadata.close()
-
-        # compute the SHA256 of the file to see if it is already known
         debian_hash = hashlib.new('sha256')
-        debian_hash.update(req.content)
+        try:
+            with meta_outname.open(mode='wb') as metadata:
+                for chunk in req.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    metadata.write(chunk)
+                    debian_hash.update(chunk)
+        except requests.exceptions.RequestException:
+            meta_outname.unlink()
+            print("Could not download Debian ls-lR.gz file, exiting.", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            req.close()
         filehash = debian_hash.hexdigest()
 
+        # store the ETag of the current file, if the mirror sent one
+        if new_etag is not None:
+            etagfile = open(etagfilename, 'w')
+            etagfile.write(new_etag)
+            etagfile.close()
+
         # the hash of the latest file should always be stored in a file called HASH
-        hashfilename = os.path.join(repo_directory, "HASH")
-        if os.path.exists(hashfilename):
+        hashfilename = pathlib.Path(repo_directory, "HASH")
+        if hashfilename.exists():
             hashfile = open(hashfilename, 'r')
             oldhashdata = hashfile.read()
             hashfile.close()
             if oldhashdata == filehash and not args.force:
                 print("Metadata for '%s' has not changed, skipping entry." % repository['name'])
-                os.unlink(meta_outname)
+                meta_outname.unlink()
+                session.close()
                 continue
 
         # write the hash of the current data to the hash file
@@ -389,123 +653,56 @@ def main():
         logging.basicConfig(filename=pathlib.Path(log_directory, 'download.log'),
                             level=logging.INFO, format='%(asctime)s %(message)s')
 
-        # now walk the ls-lR file and grab all the files in parallel
-        processmanager = multiprocessing.Manager()
-
-        # create a queue for scanning files
-        download_queue = processmanager.JoinableQueue(maxsize=0)
-        fail_queue = processmanager.JoinableQueue(maxsize=0)
-        processes = []
-
-        download_dsc = False
-        if 'dsc' in repository['categories']:
-            download_dsc = True
-
-        download_binary = False
-        if 'binary' in repository['categories']:
-            download_binary = True
-
-        download_patch = False
-        if 'patch' in repository['categories']:
-            download_patch = True
-
-        download_source = False
-        if 'source' in repository['categories']:
-            download_source = True
-
-        download_dev = False
-        if 'dev' in repository['categories']:
-            download_dev = True
-
-        # add some counters for statistics
-        deb_counter = 0
-        src_counter = 0
-        diff_counter = 0
-        dsc_counter = 0
-
-        # Process the ls-lR.gz and put all the tasks into a queue for downloading.
-        lslr = gzip.open(meta_outname)
-        inpool = False
-        curdir = ''
-
-        for i in lslr:
-            if i.decode().startswith('./pool'):
-                inpool = True
-                curdir = pathlib.Path(i.decode().rsplit(':', 1)[0][2:])
-            if not inpool:
-                continue
-
-            download_file = False
-            for debian_dir in repository['directories']:
-                if debian_dir in curdir.parts:
-                    download_file = True
-                    break
-            if not download_file:
-                continue
-
-            # end of the pool reached
-            if i.decode().startswith('./project'):
-                break
-            if i.decode().startswith('-'):
-                downloadpath = i.decode().strip().rsplit(' ', 1)[1]
-                filesize = int(re.sub(r'  +', ' ', i.decode().strip()).split(' ')[4])
-                if download_dsc and downloadpath.endswith('.dsc'):
-                    download_queue.put((curdir, downloadpath, filesize, dsc_directory))
-                    dsc_counter += 1
-                if download_binary:
-                    for ext in ['.deb', '.udeb']:
-                        if downloadpath.endswith(ext):
-                            if '-dev_' in downloadpath and not download_dev:
-                                continue
-                            for arch in repository['architectures']:
-                                arch_ext = '_%s%s' % (arch, ext)
-                                if downloadpath.endswith(arch_ext):
-                                    download_queue.put((curdir, downloadpath, filesize, binary_directory))
-                                    deb_counter += 1
-                                    break
-                if download_patch and downloadpath.endswith('.diff.gz'):
-                    download_queue.put((curdir, downloadpath, filesize, patches_directory))
-                    diff_counter += 1
-                if download_source:
-                    for ext in ['.orig.tar.bz2', '.orig.tar.gz', '.orig.tar.xz']:
-                        if downloadpath.endswith(ext):
-                            download_queue.put((curdir, downloadpath, filesize, source_directory))
-                            src_counter += 1
-                            break
+        # Process the ls-lR.gz and collect all the files that should be
+        # downloaded, which are then grabbed in parallel.
+        # Use a large read buffer: the default buffer is small, which
+        # means a lot of (slow) calls to zlib for the big ls-lR.gz file.
+        # The tasks only contain strings, as constructing and joining
+        # pathlib.Path objects for every file is relatively expensive.
+        store_directories = {'binary': str(binary_directory), 'dsc': str(dsc_directory),
+                             'patch': str(patches_directory), 'source': str(source_directory)}
+        lslr = io.BufferedReader(gzip.open(meta_outname, 'rb'),
+                                 buffer_size=LSLR_BUFFER_SIZE)
+        tasks = parse_lslr(lslr, repository, store_directories)
         lslr.close()
 
-        # create processes for unpacking archives
-        for i in range(0, threads):
-            process = multiprocessing.Process(target=downloadfile,
-                                              args=(download_queue, fail_queue, repository['mirror']))
-            processes.append(process)
-
-        # start all the processes
-        for process in processes:
-            process.start()
-
-        download_queue.join()
-
+        # record the files that were downloaded in earlier runs, so
+        # the download threads do not each have to check the disk
+        existing_files = scan_existing_files([binary_directory, source_directory,
+                                              dsc_directory, patches_directory],
+                                             repository['directories'])
+
+        # Download the files using a pool of threads. The files are
+        # handed to the threads in batches, so there is no need to
+        # create a separate future for each of the (many) files.
+        batch_size = max(1, min(DOWNLOAD_BATCH_SIZE, len(tasks) // (threads * 4)))
+        stop_event = threading.Event()
         failed_files = []
-
-        while True:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = []
+            for i in range(0, len(tasks), batch_size):
+                futures.append(executor.submit(downloadbatch, session, repository['mirror'],
+                                               existing_files, tasks[i:i+batch_size],
+                                               stop_event))
             try:
-                failed_files.append(fail_queue.get_nowait())
-                fail_queue.task_done()
-            except queue.Empty:
-                # Queue is empty
-                break
-
-        # block here until the fail_queue is empty
-        fail_queue.join()
-
-        # Done processing, terminate processes
-        for process in processes:
-            process.terminate()
+                for future in concurrent.futures.as_completed(futures):
+                    failed_files += future.result()
+            except KeyboardInterrupt:
+                # Do not start any new downloads, but let the downloads
+                # that are in progress finish, so no connections are cut
+                # off halfway. Files that are still incomplete are resumed
+                # during the next run.
+                stop_event.set()
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+                session.close()
+                raise
+        session.close()
 
         if verbose:
             len_failed = len(failed_files)
-            downloaded_files = (deb_counter + src_counter + dsc_counter + diff_counter) - len_failed
+            downloaded_files = len(tasks) - len_failed
             print("Successfully downloaded: %d files" % downloaded_files)
             print("Failed to download: %d files" % len_failed)
 
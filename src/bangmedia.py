@@ -512,7 +512,7 @@ def unpack_bmp(fileresult, scanenvironment, offset, unpackdir):
     # https://en.wikipedia.org/wiki/BMP_file_format#DIB_header_(bitmap_information_header)
     checkbytes = checkfile.read(2)
     dibheadersize = int.from_bytes(checkbytes, byteorder='little')
-    if dibheadersize not in set([12, 64, 16, 40, 52, 56, 108, 124]):
+    if dibheadersize not in {12, 64, 16, 40, 52, 56, 108, 124}:
         checkfile.close()
         unpackingerror = {'offset': offset, 'fatal': False,
                           'reason': 'invalid DIB header'}
@@ -1807,7 +1807,7 @@ def unpack_ico(fileresult, scanenvironment, offset, unpackdir):
             # the file is a BMP
             # check the DIB header
             dibheadersize = int.from_bytes(checkbytes[:2], byteorder='little')
-            if dibheadersize not in set([12, 64, 16, 40, 52, 56, 108, 124]):
+            if dibheadersize not in {12, 64, 16, 40, 52, 56, 108, 124}:
                 checkfile.close()
                 unpackingerror = {'offset': offset, 'fatal': False,
                                   'reason': 'invalid DIB header size'}
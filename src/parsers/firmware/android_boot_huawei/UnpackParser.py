@@ -47,9 +47,12 @@ class AndroidBootHuaweiUnpackParser(UnpackParser):
         except (Exception, ValidationNotEqualError) as e:
             raise UnpackParserException(e.args)
         check_condition(self.data.img_header.meta_header_size == 76, "invalid header size")
-        self.unpacked_size = 0
+        unpacked_size = 0
         for entry in self.data.img_header_entries:
-            self.unpacked_size = max(self.unpacked_size, entry.offset + entry.size)
+            entry_end = entry.offset + entry.size
+            if entry_end > unpacked_size:
+                unpacked_size = entry_end
+        self.unpacked_size = unpacked_size
         check_condition(file_size >= self.unpacked_size, "not enough data")
 
 